@@ -2,7 +2,6 @@ import json
 import logging
 import threading
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Literal, Optional
 
@@ -10,8 +9,11 @@ from ucai.core.paged_list import PagedList
 
 _logger = logging.getLogger(__name__)
 
+# Reads and writes of this module global are single atomic bytecode operations
+# under the GIL, so no lock is needed around them. A ContextVar would be
+# lock-free too, but values set in the main thread would be invisible to
+# worker threads (e.g. toolkits executing tools in a ThreadPoolExecutor).
 _uc_function_client = None
-_client_lock = threading.Lock()
 
 
 @dataclass
@@ -101,7 +103,10 @@ class BaseFunctionClient(ABC):
                 of type InputParams in unitycatalog, or FunctionParameterInfos in databricks.
             parameters: The parameters to validate.
         """
-        parameters = deepcopy(parameters)
+        # A shallow copy isolates the dict itself; validation only reads the
+        # values, so deep-copying potentially large arrays/structs per call is
+        # wasted work.
+        parameters = dict(parameters)
         if input_params and input_params.parameters:
             invalid_params: Dict[str, str] = {}
             for param in input_params.parameters:
@@ -188,12 +193,10 @@ class BaseFunctionClient(ABC):
 
 # TODO: update BaseFunctionClient to Union[BaseFunctionClient, AsyncBaseFunctionClient] after async client is supported
 def get_uc_function_client() -> Optional[BaseFunctionClient]:
-    global _uc_function_client
-
-    with _client_lock:
-        if _uc_function_client is None:
-            _logger.warning("UC function client is not set.")
-        return _uc_function_client
+    client = _uc_function_client
+    if client is None:
+        _logger.warning("UC function client is not set.")
+    return client
 
 
 def set_uc_function_client(client: BaseFunctionClient) -> None:
@@ -202,5 +205,4 @@ def set_uc_function_client(client: BaseFunctionClient) -> None:
     if client and not isinstance(client, BaseFunctionClient):
         raise ValueError("client must be an instance of BaseFunctionClient")
 
-    with _client_lock:
-        _uc_function_client = client
+    _uc_function_client = client
@@ -1,7 +1,9 @@
 import base64
+import csv
 import functools
 import json
 import logging
+import random
 import re
 import time
 from dataclasses import dataclass
@@ -25,7 +27,6 @@ from ucai.core.utils.callable_utils import generate_sql_function_body
 from ucai.core.utils.type_utils import (
     column_type_to_python_type,
     convert_timedelta_to_interval_str,
-    is_time_type,
 )
 from ucai.core.utils.validation_utils import (
     FullFunctionName,
@@ -59,6 +60,43 @@ SESSION_EXCEPTION_MESSAGE = "session_id is no longer usable"
 
 _logger = logging.getLogger(__name__)
 
+# NOTE: catalog/schema/function names follow guidance here:
+# https://docs.databricks.com/en/sql/language-manual/sql-ref-names.html#catalog-name
+_CREATE_FUNCTION_REGEX = re.compile(
+    r"""
+    CREATE\s+(?:OR\s+REPLACE\s+)?      # Match 'CREATE OR REPLACE' or just 'CREATE'
+    (?:TEMPORARY\s+)?                  # Match optional 'TEMPORARY'
+    FUNCTION\s+(?:IF\s+NOT\s+EXISTS\s+)?  # Match 'FUNCTION' and optional 'IF NOT EXISTS'
+    (?P<name>[^ /.]+\.[^ /.]+\.[^ /.]+)          # Capture the function name (including schema if present)
+    \s*\(                              # Match opening parenthesis after function name
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+# The databricks-sdk imports below stay out of module scope so importing this
+# module doesn't require the optional dependencies; the cached accessors avoid
+# re-running the import machinery on every hot-path call.
+@functools.lru_cache(maxsize=1)
+def _column_type_name_cls() -> Any:
+    from databricks.sdk.service.catalog import ColumnTypeName
+
+    return ColumnTypeName
+
+
+@functools.lru_cache(maxsize=1)
+def _statement_state_cls() -> Any:
+    from databricks.sdk.service.sql import StatementState
+
+    return StatementState
+
+
+@functools.lru_cache(maxsize=1)
+def _statement_parameter_list_item_cls() -> Any:
+    from databricks.sdk.service.sql import StatementParameterListItem
+
+    return StatementParameterListItem
+
 
 def get_default_databricks_workspace_client(profile=None) -> "WorkspaceClient":
     try:
@@ -106,20 +144,7 @@ def extract_function_name(sql_body: str) -> str:
     Extract function name from the sql body.
     CREATE FUNCTION syntax reference: https://docs.databricks.com/en/sql/language-manual/sql-ref-syntax-ddl-create-sql-function.html#syntax
     """
-    # NOTE: catalog/schema/function names follow guidance here:
-    # https://docs.databricks.com/en/sql/language-manual/sql-ref-names.html#catalog-name
-    pattern = re.compile(
-        r"""
-        CREATE\s+(?:OR\s+REPLACE\s+)?      # Match 'CREATE OR REPLACE' or just 'CREATE'
-        (?:TEMPORARY\s+)?                  # Match optional 'TEMPORARY'
-        FUNCTION\s+(?:IF\s+NOT\s+EXISTS\s+)?  # Match 'FUNCTION' and optional 'IF NOT EXISTS'
-        (?P<name>[^ /.]+\.[^ /.]+\.[^ /.]+)          # Capture the function name (including schema if present)
-        \s*\(                              # Match opening parenthesis after function name
-    """,
-        re.IGNORECASE | re.VERBOSE,
-    )
-
-    match = pattern.search(sql_body)
+    match = _CREATE_FUNCTION_REGEX.search(sql_body)
     if match:
         result = match.group("name")
         full_function_name = FullFunctionName.validate_full_function_name(result)
@@ -465,6 +490,14 @@ class DatabricksFunctionClient(BaseFunctionClient):
         """
         from databricks.sdk.service.catalog import FunctionInfo
 
+        if max_results is None and page_token is None:
+            # Without explicit pagination the SDK's own iterator works fine and
+            # avoids hand-building the request.
+            function_infos = list(
+                self.client.functions.list(catalog_name=catalog, schema_name=schema)
+            )
+            return PagedList(function_infos, None)
+
         # do not reuse self.client.functions.list because the list API in databricks-sdk
         # doesn't work for max_results and page_token
         query = {}
@@ -557,7 +590,7 @@ class DatabricksFunctionClient(BaseFunctionClient):
     def _execute_uc_functions_with_warehouse(
         self, function_info: "FunctionInfo", parameters: Dict[str, Any]
     ) -> FunctionExecutionResult:
-        from databricks.sdk.service.sql import StatementState
+        StatementState = _statement_state_cls()
 
         _logger.info("Executing function using client warehouse_id.")
 
@@ -581,7 +614,12 @@ class DatabricksFunctionClient(BaseFunctionClient):
             retry_cnt = 0
             client_execution_timeout = int(UCAI_DATABRICKS_WAREHOUSE_RETRY_TIMEOUT.get())
             while wait_time < client_execution_timeout:
-                wait = min(2**retry_cnt, client_execution_timeout - wait_time)
+                # Exponential backoff with jitter so concurrent pollers don't
+                # hit the statement API in lockstep; the SDK response doesn't
+                # surface a Retry-After hint to honor instead.
+                wait = min(
+                    2**retry_cnt + random.uniform(0, 1), client_execution_timeout - wait_time
+                )
                 time.sleep(wait)
                 _logger.info(f"Retry times: {retry_cnt}")
                 response = self.client.statement_execution.get_statement(statement_id)
@@ -624,13 +662,6 @@ class DatabricksFunctionClient(BaseFunctionClient):
                 value = data_array[0][0]
             return FunctionExecutionResult(format="SCALAR", value=value, truncated=truncated)
         else:
-            try:
-                import pandas as pd
-            except ImportError as e:
-                raise ImportError(
-                    "Could not import pandas python package. Please install it with `pip install pandas`."
-                ) from e
-
             schema = manifest.schema
             if schema is None or schema.columns is None:
                 return FunctionExecutionResult(
@@ -639,9 +670,13 @@ class DatabricksFunctionClient(BaseFunctionClient):
             columns = [c.name for c in schema.columns]
             if data_array is None:
                 data_array = []
-            pdf = pd.DataFrame(data_array, columns=columns)
+            # The result rows are already plain string values, so write them
+            # with the csv module directly instead of routing through a
+            # pandas DataFrame and to_csv.
             csv_buffer = StringIO()
-            pdf.to_csv(csv_buffer, index=False)
+            csv_writer = csv.writer(csv_buffer, lineterminator="\n")
+            csv_writer.writerow(columns)
+            csv_writer.writerows(data_array)
             return FunctionExecutionResult(
                 format="CSV", value=csv_buffer.getvalue(), truncated=truncated
             )
@@ -659,9 +694,12 @@ class DatabricksFunctionClient(BaseFunctionClient):
         else:
             row_limit = int(UCAI_DATABRICKS_SERVERLESS_EXECUTION_RESULT_ROW_LIMIT.get())
             truncated = result.count() > row_limit
-            pdf = result.limit(row_limit).toPandas()
+            # Stream rows into the CSV buffer instead of materializing the full
+            # result as a pandas DataFrame on the driver first.
             csv_buffer = StringIO()
-            pdf.to_csv(csv_buffer, index=False)
+            csv_writer = csv.writer(csv_buffer, lineterminator="\n")
+            csv_writer.writerow(result.columns)
+            csv_writer.writerows(result.limit(row_limit).toLocalIterator())
             return FunctionExecutionResult(
                 format="CSV", value=csv_buffer.getvalue(), truncated=truncated
             )
@@ -700,14 +738,11 @@ class DatabricksFunctionClient(BaseFunctionClient):
 
 
 def is_scalar(function: "FunctionInfo") -> bool:
-    from databricks.sdk.service.catalog import ColumnTypeName
-
-    return function.data_type != ColumnTypeName.TABLE_TYPE
+    return function.data_type != _column_type_name_cls().TABLE_TYPE
 
 
 def job_pending(state: "StatementState") -> bool:
-    from databricks.sdk.service.sql import StatementState
-
+    StatementState = _statement_state_cls()
     return state in (StatementState.PENDING, StatementState.RUNNING)
 
 
@@ -717,100 +752,162 @@ class ParameterizedStatement:
     parameters: List["StatementParameterListItem"]
 
 
+@functools.lru_cache(maxsize=256)
+def _type_statement_param(name: str, type_text: str) -> Any:
+    """Shared statement parameter carrying a complex type's type text.
+
+    The (name, type_text) pair repeats for every execution of the same
+    function, and the item is only ever serialized, so one instance can be
+    reused across requests.
+    """
+    return _statement_parameter_list_item_cls()(name=name, value=type_text)
+
+
+def _complex_param_clause(param_info: Any, param_value: Any, output_params: List[Any]) -> str:
+    # Use from_json to restore values of complex types.
+    name = param_info.name
+    output_params.append(
+        _statement_parameter_list_item_cls()(name=name, value=json.dumps(param_value))
+    )
+    output_params.append(_type_statement_param(f"{name}_type", param_info.type_text))
+    return f"from_json(:{name}, :{name}_type)"
+
+
+def _binary_param_clause(param_info: Any, param_value: Any, output_params: List[Any]) -> str:
+    if isinstance(param_value, bytes):
+        param_value = base64.b64encode(param_value).decode("utf-8")
+    # Use ubbase64 to restore binary values.
+    output_params.append(
+        _statement_parameter_list_item_cls()(name=param_info.name, value=param_value)
+    )
+    return f"unbase64(:{param_info.name})"
+
+
+def _time_param_clause(param_info: Any, param_value: Any, output_params: List[Any]) -> str:
+    # EAFP: date/datetime values are the common case, strings the exception.
+    try:
+        date_str = param_value.isoformat()
+    except AttributeError:
+        date_str = param_value
+    output_params.append(
+        _statement_parameter_list_item_cls()(
+            name=param_info.name, value=date_str, type=param_info.type_text
+        )
+    )
+    return f":{param_info.name}"
+
+
+def _interval_param_clause(param_info: Any, param_value: Any, output_params: List[Any]) -> str:
+    output_params.append(
+        _statement_parameter_list_item_cls()(
+            name=param_info.name,
+            value=convert_timedelta_to_interval_str(param_value)
+            if not isinstance(param_value, str)
+            else param_value,
+            type=param_info.type_text,
+        )
+    )
+    return f":{param_info.name}"
+
+
+def _default_param_clause(param_info: Any, param_value: Any, output_params: List[Any]) -> str:
+    if param_info.type_name == _column_type_name_cls().DECIMAL and isinstance(param_value, Decimal):
+        param_value = float(param_value)
+    output_params.append(
+        _statement_parameter_list_item_cls()(
+            name=param_info.name, value=param_value, type=param_info.type_text
+        )
+    )
+    return f":{param_info.name}"
+
+
+@functools.lru_cache(maxsize=1)
+def _time_column_types() -> frozenset:
+    ColumnTypeName = _column_type_name_cls()
+    return frozenset((ColumnTypeName.DATE, ColumnTypeName.TIMESTAMP, ColumnTypeName.TIMESTAMP_NTZ))
+
+
+@functools.lru_cache(maxsize=1)
+def _param_clause_dispatch() -> Dict[Any, Callable[[Any, Any, List[Any]], str]]:
+    """Maps a parameter's ColumnTypeName to its SQL clause builder."""
+    ColumnTypeName = _column_type_name_cls()
+    return {
+        ColumnTypeName.ARRAY: _complex_param_clause,
+        ColumnTypeName.MAP: _complex_param_clause,
+        ColumnTypeName.STRUCT: _complex_param_clause,
+        ColumnTypeName.BINARY: _binary_param_clause,
+        ColumnTypeName.DATE: _time_param_clause,
+        ColumnTypeName.TIMESTAMP: _time_param_clause,
+        ColumnTypeName.TIMESTAMP_NTZ: _time_param_clause,
+        ColumnTypeName.INTERVAL: _interval_param_clause,
+    }
+
+
+# Statement text keyed on the function identity and which parameters were
+# provided; for a fixed function definition the SQL shape is fully determined
+# by that signature, only the bound parameter values change between calls.
+# Bounded with oldest-first eviction so long-lived processes executing many
+# distinct functions don't grow it without limit.
+_STATEMENT_TEXT_CACHE_MAXSIZE = 256
+_statement_text_cache: Dict[Any, str] = {}
+
+
 def get_execute_function_sql_stmt(
     function: "FunctionInfo", parameters: Dict[str, Any]
 ) -> ParameterizedStatement:
-    from databricks.sdk.service.catalog import ColumnTypeName
-    from databricks.sdk.service.sql import StatementParameterListItem
+    StatementParameterListItem = _statement_parameter_list_item_cls()
 
-    parts: List[str] = []
     output_params: List[StatementParameterListItem] = []
     if is_scalar(function):
-        parts.append("SELECT IDENTIFIER(:function_name)(")
+        prefix = "SELECT IDENTIFIER(:function_name)("
         output_params.append(
             StatementParameterListItem(name="function_name", value=function.full_name)
         )
     else:
         # TODO: IDENTIFIER doesn't work
-        parts.append(f"SELECT * FROM {function.full_name}(")
+        prefix = f"SELECT * FROM {function.full_name}("
+
+    param_infos = function.input_params.parameters if function.input_params else None
+    if not (parameters and param_infos):
+        return ParameterizedStatement(statement=f"{prefix})", parameters=output_params)
+
+    dispatch_get = _param_clause_dispatch().get
+    use_named_args = False
+    provided = []
+    for param_info in param_infos:
+        if param_info.name not in parameters:
+            # validate_input_params has validated param_info.parameter_default exists
+            use_named_args = True
+        else:
+            provided.append((param_info, use_named_args))
 
-    if parameters and function.input_params and function.input_params.parameters:
-        args: List[str] = []
-        use_named_args = False
-        for param_info in function.input_params.parameters:
-            if param_info.name not in parameters:
-                # validate_input_params has validated param_info.parameter_default exists
-                use_named_args = True
-            else:
-                arg_clause = ""
-                if use_named_args:
-                    arg_clause += f"{param_info.name} => "
-                param_value = parameters[param_info.name]
-                if param_info.type_name in (
-                    ColumnTypeName.ARRAY,
-                    ColumnTypeName.MAP,
-                    ColumnTypeName.STRUCT,
-                ):
-                    # Use from_json to restore values of complex types.
-                    json_value_str = json.dumps(param_value)
-                    arg_clause += f"from_json(:{param_info.name}, :{param_info.name}_type)"
-                    output_params.append(
-                        StatementParameterListItem(name=param_info.name, value=json_value_str)
-                    )
-                    output_params.append(
-                        StatementParameterListItem(
-                            name=f"{param_info.name}_type", value=param_info.type_text
-                        )
-                    )
-                elif param_info.type_name == ColumnTypeName.BINARY:
-                    if isinstance(param_value, bytes):
-                        param_value = base64.b64encode(param_value).decode("utf-8")
-                    # Use ubbase64 to restore binary values.
-                    arg_clause += f"unbase64(:{param_info.name})"
-                    output_params.append(
-                        StatementParameterListItem(name=param_info.name, value=param_value)
-                    )
-                elif is_time_type(param_info.type_name.value):
-                    date_str = (
-                        param_value if isinstance(param_value, str) else param_value.isoformat()
-                    )
-                    arg_clause += f":{param_info.name}"
-                    output_params.append(
-                        StatementParameterListItem(
-                            name=param_info.name, value=date_str, type=param_info.type_text
-                        )
-                    )
-                elif param_info.type_name == ColumnTypeName.INTERVAL:
-                    arg_clause += f":{param_info.name}"
-                    output_params.append(
-                        StatementParameterListItem(
-                            name=param_info.name,
-                            value=convert_timedelta_to_interval_str(param_value)
-                            if not isinstance(param_value, str)
-                            else param_value,
-                            type=param_info.type_text,
-                        )
-                    )
-                else:
-                    if param_info.type_name == ColumnTypeName.DECIMAL and isinstance(
-                        param_value, Decimal
-                    ):
-                        param_value = float(param_value)
-                    arg_clause += f":{param_info.name}"
-                    output_params.append(
-                        StatementParameterListItem(
-                            name=param_info.name, value=param_value, type=param_info.type_text
-                        )
-                    )
-                args.append(arg_clause)
-        parts.append(",".join(args))
-    parts.append(")")
-    statement = "".join(parts)
+    cache_key = (
+        function.full_name,
+        function.data_type,
+        tuple((param_info.name, param_info.type_name, named) for param_info, named in provided),
+    )
+    statement = _statement_text_cache.get(cache_key)
+    args = [] if statement is None else None
+    for param_info, named in provided:
+        handler = dispatch_get(param_info.type_name, _default_param_clause)
+        arg_clause = handler(param_info, parameters[param_info.name], output_params)
+        if args is not None:
+            if named:
+                arg_clause = f"{param_info.name} => {arg_clause}"
+            args.append(arg_clause)
+    if statement is None:
+        statement = f"{prefix}{','.join(args)})"
+        if len(_statement_text_cache) >= _STATEMENT_TEXT_CACHE_MAXSIZE:
+            # Default on pop: concurrent execute_function calls may race to
+            # evict the same victim, and a transiently over-bound dict is
+            # preferable to a KeyError escaping on valid input.
+            _statement_text_cache.pop(next(iter(_statement_text_cache)), None)
+        _statement_text_cache[cache_key] = statement
     return ParameterizedStatement(statement=statement, parameters=output_params)
 
 
 def get_execute_function_sql_command(function: "FunctionInfo", parameters: Dict[str, Any]) -> str:
-    from databricks.sdk.service.catalog import ColumnTypeName
+    ColumnTypeName = _column_type_name_cls()
 
     sql_query = ""
     if is_scalar(function):
@@ -843,10 +940,11 @@ def get_execute_function_sql_command(function: "FunctionInfo", parameters: Dict[
                         param_value = base64.b64encode(param_value).decode("utf-8")
                     # Use ubbase64 to restore binary values.
                     arg_clause += f"unbase64('{param_value}')"
-                elif is_time_type(param_info.type_name.value):
-                    date_str = (
-                        param_value if isinstance(param_value, str) else param_value.isoformat()
-                    )
+                elif param_info.type_name in _time_column_types():
+                    try:
+                        date_str = param_value.isoformat()
+                    except AttributeError:
+                        date_str = param_value
                     arg_clause += f"'{date_str}'"
                 elif param_info.type_name == ColumnTypeName.INTERVAL:
                     interval_str = (
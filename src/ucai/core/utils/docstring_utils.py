@@ -1,19 +1,28 @@
+import functools
+import io
+import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-PLACEHOLDER = "..."
 
-
-@dataclass
+@dataclass(frozen=True)
 class DocstringInfo:
     """Dataclass to store parsed docstring information."""
 
+    __slots__ = ("description", "params", "returns")
+
     description: str
-    params: Optional[dict[str, Optional[str]]]
+    params: Mapping[str, Optional[str]]
     returns: Optional[str]
 
 
+# Shared read-only mapping for the common no-params case; frozen results let
+# the cache hand out the same instance to every caller.
+_EMPTY_PARAMS = MappingProxyType({})
+
+
 class State(Enum):
     DESCRIPTION = "DESCRIPTION"
     ARGS = "ARGS"
@@ -27,6 +36,10 @@ def parse_docstring(docstring: str) -> DocstringInfo:
     and return value description.
     Handles both reStructuredText and Google-style docstrings.
 
+    Parsing results are cached on the raw docstring content, so repeated calls
+    for the same docstring (e.g. when a toolkit re-derives schemas per invocation)
+    skip the parsing work entirely.
+
     Args:
         docstring: The docstring to parse.
 
@@ -36,116 +49,119 @@ def parse_docstring(docstring: str) -> DocstringInfo:
     Raises:
         ValueError: If the docstring is empty or missing a function description.
     """
-
+    # Reject empty docstrings before any cache lookup or parsing work; failed
+    # calls are never cached, so checking inside the worker would re-run on
+    # every call anyway.
     if not docstring or not docstring.strip():
         raise ValueError(
             "Docstring is empty. Please provide a docstring with a function description."
         )
+    # Results are frozen (immutable dataclass with a read-only params mapping),
+    # so the cached instance itself is shared with every caller.
+    return _parse_docstring_cached(docstring)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_docstring_cached(docstring: str) -> DocstringInfo:
+    # Single pass over the docstring lines: each line is classified once and
+    # routed by the current section state, with no intermediate section lists.
+    description_parts: list[str] = []
+    returns_parts: list[str] = []
+    parsed_params: dict[str, Optional[str]] = {}
+    state = State.DESCRIPTION
+    param_indent = None
+    current_param = None
+    # A single reusable buffer avoids reallocating a list per parameter and the
+    # repeated " ".join copies; each description is materialized exactly once.
+    description_buffer = io.StringIO()
 
-    sections = _split_docstring_sections(docstring)
-    description = _parse_description(sections["description"])
-    params = _parse_params(sections["args"])
-    returns = _parse_returns(sections["returns"])
-
-    return DocstringInfo(description=description, params=params, returns=returns)
-
-
-def _split_docstring_sections(docstring: str) -> dict[str, list[str]]:
-    """Splits the docstring into sections: description, args, and returns."""
-    lines = docstring.strip().splitlines()
-    sections = {"description": [], "args": [], "returns": []}
-    current_section = "description"
-    section_titles = {"Args:": "args", "Arguments:": "args", "Returns:": "returns"}
-
-    for line in lines:
+    # StringIO yields lines lazily, so the docstring isn't materialized a
+    # second time as a list of line strings.
+    for line in io.StringIO(docstring.strip()):
         stripped_line = line.strip()
-        matched_section = False
-        for title, section in section_titles.items():
-            if stripped_line.startswith(title):
-                current_section = section
-                content = stripped_line[len(title) :].strip()
-                if content:
-                    sections[current_section].append(content)
-                matched_section = True
-                break
-        if matched_section:
+        if stripped_line.startswith("Args:"):
+            state = State.ARGS
+            is_header = True
+            content = stripped_line[5:].strip()
+        elif stripped_line.startswith("Arguments:"):
+            state = State.ARGS
+            is_header = True
+            content = stripped_line[10:].strip()
+        elif stripped_line.startswith("Returns:"):
+            state = State.RETURNS
+            is_header = True
+            content = stripped_line[8:].strip()
+        else:
+            is_header = False
+            content = stripped_line
+
+        if is_header:
+            if not content:
+                continue
+            # Inline section content is processed as the section's first line.
+            line = stripped_line = content
+            indent = 0
+        elif not stripped_line:
             continue
-        sections[current_section].append(line)
-    return sections
+        else:
+            indent = len(line) - len(line.lstrip())
+
+        if state is State.ARGS:
+            lstripped_line = line.lstrip()
+            if param_indent is None:
+                param_indent = indent
+            if indent < param_indent:
+                current_param = _finalize_current_param(
+                    parsed_params, current_param, description_buffer
+                )
+                continue
+            # partition scans the line once and never raises, replacing the
+            # separate "in" check plus split (two scans and a list allocation).
+            param_part, sep, desc_part = lstripped_line.partition(":")
+            if sep:
+                if indent == param_indent:
+                    current_param = _finalize_current_param(
+                        parsed_params, current_param, description_buffer
+                    )
+                    # Parameter names recur across docstrings and as dict keys
+                    # downstream; interning makes those lookups pointer checks.
+                    current_param = sys.intern(_extract_param_name(param_part.strip()))
+                    if desc_part := desc_part.strip():
+                        description_buffer.write(desc_part)
+                        description_buffer.write(" ")
+                elif current_param:
+                    description_buffer.write(lstripped_line.rstrip())
+                    description_buffer.write(" ")
+            elif current_param:
+                description_buffer.write(lstripped_line.rstrip())
+                description_buffer.write(" ")
+        elif state is State.DESCRIPTION:
+            description_parts.append(stripped_line)
+        else:
+            returns_parts.append(stripped_line)
 
+    _finalize_current_param(parsed_params, current_param, description_buffer)
 
-def _parse_description(lines: list[str]) -> str:
-    description_lines = [line.strip() for line in lines if line.strip()]
-    description = " ".join(description_lines).strip()
+    description = " ".join(description_parts)
     if not description:
         raise ValueError(
             "Function description is missing in the docstring. Please provide a function description."
         )
-    return description
-
+    returns = " ".join(returns_parts) or None
 
-def _parse_params(lines: list[str]) -> dict[str, Optional[str]]:
-    parsed_params = {}
-    if not lines:
-        return parsed_params
-
-    param_indent = None
-    current_param = None
-    param_description_lines = []
-
-    for line in lines:
-        if not line.strip():
-            continue
-
-        stripped_line = line.lstrip()
-        indent = len(line) - len(stripped_line)
-
-        if param_indent is None:
-            param_indent = indent
-
-        if indent < param_indent:
-            current_param, param_description_lines = _finalize_current_param(
-                parsed_params, current_param, param_description_lines
-            )
-            continue
-
-        if ":" in stripped_line:
-            param_part, desc_part = stripped_line.split(":", 1)
-            param_name = _extract_param_name(param_part.strip())
-
-            if indent == param_indent:
-                current_param, param_description_lines = _finalize_current_param(
-                    parsed_params, current_param, param_description_lines
-                )
-                current_param = param_name
-                param_description_lines = [desc_part.strip()] if desc_part.strip() else []
-            else:
-                if current_param:
-                    param_description_lines.append(stripped_line)
-        else:
-            if current_param:
-                param_description_lines.append(stripped_line)
-
-    _finalize_current_param(parsed_params, current_param, param_description_lines)
-    return parsed_params
-
-
-def _parse_returns(lines: list[str]) -> Optional[str]:
-    if not lines:
-        return None
-    return_description = " ".join(line.strip() for line in lines if line.strip()).strip()
-    if return_description == PLACEHOLDER:
-        return PLACEHOLDER
-    return return_description if return_description else None
+    params = MappingProxyType(parsed_params) if parsed_params else _EMPTY_PARAMS
+    return DocstringInfo(description=description, params=params, returns=returns)
 
 
 def _finalize_current_param(
-    parsed_params: dict, current_param: Optional[str], param_description_lines: list[str]
-) -> tuple[Optional[str], list[str]]:
+    parsed_params: dict, current_param: Optional[str], description_buffer: io.StringIO
+) -> None:
     if current_param is not None:
-        description = " ".join(param_description_lines).strip()
+        description = description_buffer.getvalue().strip()
         parsed_params[current_param] = description if description else None
-    return None, []
+    description_buffer.seek(0)
+    description_buffer.truncate()
+    return None
 
 
 def _extract_param_name(param_part: str) -> str:
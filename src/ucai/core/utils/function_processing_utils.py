@@ -1,4 +1,5 @@
 import decimal
+import functools
 import json
 import logging
 import os
@@ -18,6 +19,13 @@ from ucai.core.utils.validation_utils import FullFunctionName
 
 _logger = logging.getLogger(__name__)
 
+# Resolve the Union[...] form of every mapping entry once at import time;
+# subscripting typing.Union per call is comparatively expensive.
+_UC_TYPE_TO_PYDANTIC_TYPE = {
+    type_name: Union[python_types] for type_name, python_types in UC_TYPE_JSON_MAPPING.items()
+}
+_DECIMAL_PYDANTIC_TYPE = Union[decimal.Decimal, float]
+
 
 def uc_type_json_to_pydantic_type(
     uc_type_json: Union[str, Dict[str, Any]], strict: bool = False
@@ -31,6 +39,9 @@ def uc_type_json_to_pydantic_type(
     For complex types, the type json is a dictionary representing the type. For example:
         {"type": "array", "elementType": "STRING", "containsNull": true} -> List[Optional[str]]
 
+    Conversions are memoized on the canonical (key-sorted) JSON form of the type,
+    so repeated structs don't rebuild their pydantic models via `create_model`.
+
     Args:
         uc_type_json: The Unity Catalog function input parameter type json.
         strict: Whether the type strictly follows the JSON schema type. This is used for OpenAI only.
@@ -40,13 +51,33 @@ def uc_type_json_to_pydantic_type(
             pydantic_type: The python type or Pydantic type.
             strict: Whether the type strictly follows the JSON schema type. This is used for OpenAI only.
     """
+    if isinstance(uc_type_json, dict):
+        canonical_type_json = json.dumps(uc_type_json, sort_keys=True)
+        return _uc_type_json_to_pydantic_type_cached(canonical_type_json, True, strict)
+    elif isinstance(uc_type_json, str):
+        return _uc_type_json_to_pydantic_type_cached(uc_type_json, False, strict)
+    raise TypeError(f"Unknown type {uc_type_json}.")
+
+
+@functools.lru_cache(maxsize=256)
+def _uc_type_json_to_pydantic_type_cached(
+    uc_type_json: str, is_complex: bool, strict: bool
+) -> PydanticType:
+    if is_complex:
+        uc_type_json = json.loads(uc_type_json)
+    return _uc_type_json_to_pydantic_type_uncached(uc_type_json, strict)
+
+
+def _uc_type_json_to_pydantic_type_uncached(
+    uc_type_json: Union[str, Dict[str, Any]], strict: bool = False
+) -> PydanticType:
     if isinstance(uc_type_json, str):
         type_name = uc_type_json.upper()
-        if type_name in UC_TYPE_JSON_MAPPING:
-            pydantic_type = Union[UC_TYPE_JSON_MAPPING[type_name]]
+        if type_name in _UC_TYPE_TO_PYDANTIC_TYPE:
+            pydantic_type = _UC_TYPE_TO_PYDANTIC_TYPE[type_name]
         # the type text contains the precision and scale
         elif type_name.startswith("DECIMAL"):
-            pydantic_type = Union[decimal.Decimal, float]
+            pydantic_type = _DECIMAL_PYDANTIC_TYPE
         else:
             raise TypeError(
                 f"Type {uc_type_json} is not supported. Supported "
@@ -56,58 +87,76 @@ def uc_type_json_to_pydantic_type(
             strict = False
     elif isinstance(uc_type_json, dict):
         type_ = uc_type_json["type"]
-        if type_ == "array":
-            element_pydantic_type = uc_type_json_to_pydantic_type(
-                uc_type_json["elementType"], strict=strict
-            )
-            strict = strict and element_pydantic_type.strict
-            element_type = element_pydantic_type.pydantic_type
-            if uc_type_json["containsNull"]:
-                element_type = Optional[element_type]
-            pydantic_type = Union[List[element_type], Tuple[element_type, ...]]
-        elif type_ == "map":
-            key_type = uc_type_json["keyType"]
-            if key_type != "string":
-                raise TypeError(f"Only support STRING key type for MAP but got {key_type}.")
-            value_pydantic_type = uc_type_json_to_pydantic_type(
-                uc_type_json["valueType"], strict=strict
-            )
-            strict = strict and value_pydantic_type.strict
-            value_type = value_pydantic_type.pydantic_type
-            if uc_type_json["valueContainsNull"]:
-                value_type = Optional[value_type]
-            pydantic_type = Dict[str, value_type]
-        elif type_ == "struct":
-            fields = {}
-            for field in uc_type_json["fields"]:
-                field_pydantic_type = uc_type_json_to_pydantic_type(field["type"])
-                strict = strict and field_pydantic_type.strict
-                field_type = field_pydantic_type.pydantic_type
-                comment = field.get("metadata", {}).get("comment")
-                if field.get("nullable"):
-                    field_type = Optional[field_type]
-                    fields[field["name"]] = (field_type, Field(default=None, description=comment))
-                else:
-                    fields[field["name"]] = (field_type, Field(..., description=comment))
-            uc_type_json_str = json.dumps(uc_type_json, sort_keys=True)
-            type_hash = md5(uc_type_json_str.encode(), usedforsecurity=False).hexdigest()[:8]
-            pydantic_type = create_model(f"Struct_{type_hash}", **fields)
+        if (handler := _COMPLEX_TYPE_DISPATCH.get(type_)) is None:
+            raise TypeError(f"Unknown type {uc_type_json}.")
+        return handler(uc_type_json, strict)
     else:
         raise TypeError(f"Unknown type {uc_type_json}.")
     return PydanticType(pydantic_type=pydantic_type, strict=strict)
 
 
+def _build_array_type(uc_type_json: Dict[str, Any], strict: bool) -> PydanticType:
+    element_pydantic_type = uc_type_json_to_pydantic_type(
+        uc_type_json["elementType"], strict=strict
+    )
+    strict = strict and element_pydantic_type.strict
+    element_type = element_pydantic_type.pydantic_type
+    if uc_type_json["containsNull"]:
+        element_type = Optional[element_type]
+    return PydanticType(
+        pydantic_type=Union[List[element_type], Tuple[element_type, ...]], strict=strict
+    )
+
+
+def _build_map_type(uc_type_json: Dict[str, Any], strict: bool) -> PydanticType:
+    key_type = uc_type_json["keyType"]
+    if key_type != "string":
+        raise TypeError(f"Only support STRING key type for MAP but got {key_type}.")
+    value_pydantic_type = uc_type_json_to_pydantic_type(uc_type_json["valueType"], strict=strict)
+    strict = strict and value_pydantic_type.strict
+    value_type = value_pydantic_type.pydantic_type
+    if uc_type_json["valueContainsNull"]:
+        value_type = Optional[value_type]
+    return PydanticType(pydantic_type=Dict[str, value_type], strict=strict)
+
+
+def _build_struct_type(uc_type_json: Dict[str, Any], strict: bool) -> PydanticType:
+    fields = {}
+    for field in uc_type_json["fields"]:
+        field_pydantic_type = uc_type_json_to_pydantic_type(field["type"])
+        strict = strict and field_pydantic_type.strict
+        field_type = field_pydantic_type.pydantic_type
+        comment = field.get("metadata", {}).get("comment")
+        if field.get("nullable"):
+            field_type = Optional[field_type]
+            fields[field["name"]] = (field_type, Field(default=None, description=comment))
+        else:
+            fields[field["name"]] = (field_type, Field(..., description=comment))
+    uc_type_json_str = json.dumps(uc_type_json, sort_keys=True)
+    # digest()[:4].hex() yields the same 8 hex chars as hexdigest()[:8] without
+    # hex-encoding the full 16-byte digest first.
+    type_hash = md5(uc_type_json_str.encode(), usedforsecurity=False).digest()[:4].hex()
+    return PydanticType(pydantic_type=create_model(f"Struct_{type_hash}", **fields), strict=strict)
+
+
+_COMPLEX_TYPE_DISPATCH = {
+    "array": _build_array_type,
+    "map": _build_map_type,
+    "struct": _build_struct_type,
+}
+
+
 def get_tool_name(func_name: str) -> str:
     # OpenAI has constriant on the function name:
     # Must be a-z, A-Z, 0-9, or contain underscores and dashes, with a maximum length of 64.
     full_func_name = FullFunctionName.validate_full_function_name(func_name)
     tool_name = full_func_name.to_tool_name()
-    if len(tool_name) > 64:
-        _logger.warning(
-            f"Function name {tool_name} is too long, truncating to 64 characters {tool_name[-64:]}."
-        )
-        return tool_name[-64:]
-    return tool_name
+    if len(tool_name) <= 64:
+        return tool_name
+    _logger.warning(
+        f"Function name {tool_name} is too long, truncating to 64 characters {tool_name[-64:]}."
+    )
+    return tool_name[-64:]
 
 
 def construct_original_function_name(tool_name: str) -> str:
@@ -155,13 +204,19 @@ def process_function_names(
     Returns:
         Dict[str, Any]: The updated tools dictionary.
     """
-    max_results = int(
-        os.environ.get("UC_LIST_FUNCTIONS_MAX_RESULTS", UC_LIST_FUNCTIONS_MAX_RESULTS)
-    )
+    max_results = None
     for name in function_names:
         if name not in tools_dict:
             full_func_name = FullFunctionName.validate_full_function_name(name)
             if full_func_name.function == "*":
+                # Only consult the environment when a wildcard actually needs
+                # the page size, and at most once per call.
+                if max_results is None:
+                    max_results = int(
+                        os.environ.get(
+                            "UC_LIST_FUNCTIONS_MAX_RESULTS", UC_LIST_FUNCTIONS_MAX_RESULTS
+                        )
+                    )
                 token = None
                 while True:
                     functions = client.list_functions(
@@ -170,11 +225,15 @@ def process_function_names(
                         max_results=max_results,
                         page_token=token,
                     )
-                    for f in functions:
-                        if f.full_name not in tools_dict:
-                            tools_dict[f.full_name] = uc_function_to_tool_func(
+                    tools_dict.update(
+                        {
+                            f.full_name: uc_function_to_tool_func(
                                 function_info=f, client=client, **kwargs
                             )
+                            for f in functions
+                            if f.full_name not in tools_dict
+                        }
+                    )
                     token = functions.token
                     if token is None:
                         break
@@ -197,19 +256,20 @@ def param_info_to_pydantic_type(param_info: Any, strict: bool = False) -> Pydant
     """
     if not isinstance(param_info, supported_param_info_types()):
         raise TypeError(f"Unsupported parameter info type: {type(param_info)}")
-    if param_info.type_json is None:
+    raw_type_json = param_info.type_json
+    if raw_type_json is None:
         raise ValueError(f"Parameter type json is None for parameter {param_info.name}.")
-    type_json = json.loads(param_info.type_json)
+    type_json = json.loads(raw_type_json)
     nullable = type_json.get("nullable")
     pydantic_type = uc_type_json_to_pydantic_type(type_json["type"], strict=strict)
     pydantic_field_type = pydantic_type.pydantic_type
     default = None
     description = param_info.comment or ""
-    if param_info.parameter_default:
+    if parameter_default := param_info.parameter_default:
         # Note: DEFAULT is supported for LANGUAGE SQL only.
         # TODO: verify this for all types
-        default = json.loads(param_info.parameter_default)
-        description = f"{description} (Default: {param_info.parameter_default})"
+        default = json.loads(parameter_default)
+        description = f"{description} (Default: {parameter_default})"
     elif nullable:
         pydantic_field_type = Optional[pydantic_field_type]
     return PydanticField(
@@ -244,21 +304,51 @@ def generate_function_input_params_schema(
     param_infos = function_info.input_params.parameters
     if param_infos is None:
         raise ValueError("Function input parameters are None.")
-    fields = {}
-    for param_info in param_infos:
-        pydantic_field = param_info_to_pydantic_type(param_info, strict=strict)
-        fields[param_info.name] = (
+    # The generated model only depends on the function identity and its input
+    # parameter definitions; include the parameter repr in the key so a
+    # recreated function with a changed signature doesn't hit a stale entry.
+    cache_key = (
+        f"{function_info.catalog_name}.{function_info.schema_name}.{function_info.name}",
+        repr(param_infos),
+        strict,
+    )
+    if (cached := _input_params_schema_cache.get(cache_key)) is not None:
+        return cached
+    pydantic_fields = [
+        (param_info.name, param_info_to_pydantic_type(param_info, strict=strict))
+        for param_info in param_infos
+    ]
+    fields = {
+        name: (
             pydantic_field.pydantic_type,
             Field(default=pydantic_field.default, description=pydantic_field.description),
         )
+        for name, pydantic_field in pydantic_fields
+    }
     model = create_model(
         f"{function_info.catalog_name}__{function_info.schema_name}__{function_info.name}__params",
         **fields,
     )
-    return PydanticFunctionInputParams(pydantic_model=model, strict=pydantic_field.strict)
+    strict = pydantic_fields[-1][1].strict if pydantic_fields else strict
+    result = PydanticFunctionInputParams(pydantic_model=model, strict=strict)
+    if len(_input_params_schema_cache) >= _INPUT_PARAMS_SCHEMA_CACHE_MAXSIZE:
+        # Evict the oldest entry so recreated functions with changing
+        # signatures can't pin generated model classes without bound. The pop
+        # default tolerates concurrent schema builds racing to evict the same
+        # victim; a transiently over-bound dict beats a KeyError.
+        _input_params_schema_cache.pop(next(iter(_input_params_schema_cache)), None)
+    _input_params_schema_cache[cache_key] = result
+    return result
+
+
+# A plain bounded dict rather than lru_cache because the model is built from
+# unhashable SDK objects; only the derived key is hashable.
+_INPUT_PARAMS_SCHEMA_CACHE_MAXSIZE = 256
+_input_params_schema_cache: Dict[Tuple[str, str, bool], PydanticFunctionInputParams] = {}
 
 
 # TODO: add UC OSS support
+@functools.lru_cache(maxsize=1)
 def supported_param_info_types():
     types = ()
     try:
@@ -272,6 +362,7 @@ def supported_param_info_types():
 
 
 # TODO: add UC OSS support
+@functools.lru_cache(maxsize=1)
 def supported_function_info_types():
     types = ()
     try:
@@ -1,5 +1,6 @@
 import datetime
 import decimal
+import functools
 from typing import Any, get_args, get_origin
 
 PYTHON_TO_SQL_TYPE_MAPPING = {
@@ -50,6 +51,8 @@ SQL_TYPE_TO_PYTHON_TYPE_MAPPING = {
     "USER_DEFINED_TYPE": object,
 }
 
+TIME_TYPES = frozenset(("DATE", "TIMESTAMP", "TIMESTAMP_NTZ"))
+
 UC_TYPE_JSON_MAPPING = {
     **SQL_TYPE_TO_PYTHON_TYPE_MAPPING,
     "INTEGER": int,
@@ -72,9 +75,10 @@ def column_type_to_python_type(column_type: str) -> Any:
     Raises:
         ValueError: If the column type is unsupported.
     """
-    if t := SQL_TYPE_TO_PYTHON_TYPE_MAPPING.get(column_type):
-        return t
-    raise ValueError(f"Unsupported column type: {column_type}")
+    try:
+        return SQL_TYPE_TO_PYTHON_TYPE_MAPPING[column_type]
+    except KeyError:
+        raise ValueError(f"Unsupported column type: {column_type}") from None
 
 
 def is_time_type(column_type: str) -> bool:
@@ -86,17 +90,17 @@ def is_time_type(column_type: str) -> bool:
     Returns:
         bool: True if the column type is time-related, False otherwise.
     """
-    return column_type in (
-        "DATE",
-        "TIMESTAMP",
-        "TIMESTAMP_NTZ",
-    )
+    return column_type in TIME_TYPES
 
 
+@functools.lru_cache(maxsize=128)
 def convert_timedelta_to_interval_str(time_val: datetime.timedelta) -> str:
     """
     Convert a timedelta object to a string representing an interval in the format of 'INTERVAL "d hh:mm:ss.ssssss"'.
     """
+    # Note: timedelta.__str__ pads its fields (e.g. "4 days, 4:00:00") while the
+    # emitted literal is unpadded, so formatting stays on the divmod path; the
+    # cache makes repeated conversions of the same interval a dict hit.
     days = time_val.days
     hours, remainder = divmod(time_val.seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
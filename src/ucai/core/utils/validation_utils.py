@@ -1,9 +1,22 @@
 import base64
 import datetime
+import re
 from typing import Any, NamedTuple
 
 from ucai.core.utils.type_utils import is_time_type
 
+# Structural shape of a valid base64 payload: base64 alphabet characters with
+# at most two '=' padding characters at the end. No length check - b64decode
+# with validate=True is lenient about padding, so length-based rejection would
+# refuse strings the decoder accepts.
+_BASE64_STRUCTURE_REGEX = re.compile(r"\A[A-Za-z0-9+/]*={0,2}\Z")
+
+# Day-time interval literals must start with INTERVAL and end with DAY TO SECOND;
+# the literal body itself is validated by the SQL function.
+# \Z (not $) so a trailing newline is rejected, matching the original
+# startswith/endswith check.
+_INTERVAL_DAY_TO_SECOND_REGEX = re.compile(r"\AINTERVAL.*DAY TO SECOND\Z", re.DOTALL)
+
 
 class FullFunctionName(NamedTuple):
     catalog: str
@@ -27,8 +40,8 @@ class FullFunctionName(NamedTuple):
         Returns:
             FullFunctionName: The parsed full function name.
         """
-        splits = function_name.split(".")
-        if len(splits) != 3:
+        splits = function_name.rsplit(".", 2)
+        if len(splits) != 3 or "." in splits[0]:
             raise ValueError(
                 f"Invalid function name: {function_name}, expecting format <catalog_name>.<schema_name>.<function_name>."
             )
@@ -36,6 +49,10 @@ class FullFunctionName(NamedTuple):
 
 
 def is_base64_encoded(s: str) -> bool:
+    # Cheap structural check first so obviously invalid strings skip the
+    # b64decode attempt (and its exception handling) entirely.
+    if not _BASE64_STRUCTURE_REGEX.match(s):
+        return False
     try:
         base64.b64decode(s, validate=True)
         return True
@@ -66,9 +83,7 @@ def validate_param(param: Any, column_type: str, param_type_text: str) -> None:
             )
         # Only DAY TO SECOND is supported in python udf
         # rely on the SQL function for checking the interval format
-        elif isinstance(param, str) and not (
-            param.startswith("INTERVAL") and param.endswith("DAY TO SECOND")
-        ):
+        elif isinstance(param, str) and not _INTERVAL_DAY_TO_SECOND_REGEX.match(param):
             raise ValueError(
                 f"Invalid interval string: {param}, expecting format `INTERVAL '[+|-] d[...] [h]h:[m]m:[s]s.ms[ms][ms][us][us][us]' DAY TO SECOND`."
             )
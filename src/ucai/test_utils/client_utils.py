@@ -25,7 +25,9 @@ def requires_databricks(test_func):
 
 
 # TODO: CI -- only support python 3.10, test with databricks-connect 15.1.0 + serverless
-@pytest.fixture
+# Module-scoped: none of the tests mutate the client, so one instance per test
+# module avoids reconstructing DatabricksFunctionClient for every test case.
+@pytest.fixture(scope="module")
 def client() -> DatabricksFunctionClient:
     if TEST_IN_DATABRICKS:
         return DatabricksFunctionClient(warehouse_id=WAREHOUSE_ID, profile=PROFILE)
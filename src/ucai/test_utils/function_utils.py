@@ -1,5 +1,7 @@
+import itertools
 import logging
-import uuid
+import os
+import time
 from contextlib import contextmanager
 from typing import Any, Callable, Generator, NamedTuple, Optional
 
@@ -10,15 +12,20 @@ CATALOG = "integration_testing"
 
 _logger = logging.getLogger(__name__)
 
+# Seeded once per process from the nanosecond clock mixed with the pid, so
+# generated names stay unique across concurrent runs against the shared
+# catalog without paying a uuid4 getrandom syscall per name.
+_func_name_counter = itertools.count(time.time_ns() ^ (os.getpid() << 32))
+
 
 def random_func_name(schema: str):
     """
-    Generate a random function name in the format of `<catalog>.<schema>.<function_name>`.
+    Generate a unique function name in the format of `<catalog>.<schema>.<function_name>`.
 
     Args:
         schema: The schema name to use in the function name.
     """
-    return f"{CATALOG}.{schema}.test_{uuid.uuid4().hex[:4]}"
+    return f"{CATALOG}.{schema}.test_{next(_func_name_counter):x}"
 
 
 @contextmanager
@@ -1,6 +1,5 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 import pytest
 from typing_extensions import override
@@ -11,16 +10,18 @@ from ucai.core.client import (
     set_uc_function_client,
 )
 
+# Pre-resolved lookup so validation is a dict hit + isinstance instead of a
+# type-name string comparison per parameter.
+TYPE_NAME_TO_PYTHON_TYPE = {"int": int, "str": str, "float": float, "bool": bool}
 
-@dataclass
-class MockParamInfo:
+
+class MockParamInfo(NamedTuple):
     name: str
     type_name: str
     parameter_default: Optional[Any] = None
 
 
-@dataclass
-class MockInputParams:
+class MockInputParams(NamedTuple):
     parameters: List[MockParamInfo]
 
 
@@ -50,7 +51,8 @@ class MockClient(BaseFunctionClient):
 
     @override
     def _validate_param_type(self, value: Any, param_info: MockParamInfo) -> None:
-        if type(value).__name__ != param_info.type_name:
+        expected_type = TYPE_NAME_TO_PYTHON_TYPE.get(param_info.type_name)
+        if expected_type is None or type(value) is not expected_type:
             raise ValueError(
                 f"Expected type {param_info.type_name}, but got {type(value).__name__}"
             )
@@ -1,10 +1,13 @@
 import base64
 import datetime
+import functools
+import logging
 import os
 import re
 import time
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, NamedTuple, Union
+from typing import Any, Callable, Dict, List, Union
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -46,21 +49,46 @@ from ucai.test_utils.function_utils import (
 
 SCHEMA = os.environ.get("SCHEMA", "ucai_core_test")
 
+_logger = logging.getLogger(__name__)
+
+# Encoded once at import; the binary-input samples otherwise re-encode the
+# same constant every time they are built.
+_HELLO_B64 = base64.b64encode(b"Hello").decode("utf-8")
+
+# Shared literal values reused across the sample builders and validate-param
+# cases, allocated once instead of per use.
+_TEST_DATE = datetime.date(2024, 8, 19)
+_TEST_DATETIME = datetime.datetime(2024, 8, 19, 11, 2, 3)
+_TEST_TIMEDELTA = datetime.timedelta(days=1, hours=3)
+_TEST_DECIMAL = Decimal("123.45")
+
+
+# Frozen slotted dataclasses instead of NamedTuples: instances are smaller,
+# skip the tuple __new__ machinery, and stay safely shareable from the
+# memoized builders below. slots=True needs Python 3.10+, hence the manual
+# __slots__.
+@dataclass(frozen=True)
+class FunctionInputOutput:
+    __slots__ = ("sql_body", "inputs", "output")
 
-class FunctionInputOutput(NamedTuple):
     sql_body: str
     inputs: List[Dict[str, Any]]
     output: str
 
 
-class PythonFunctionInputOutput(NamedTuple):
+@dataclass(frozen=True)
+class PythonFunctionInputOutput:
+    __slots__ = ("func", "inputs", "output")
+
     func: Callable
     inputs: List[Dict[str, Any]]
     output: str
 
 
-def function_with_struct_input(func_name: str) -> FunctionInputOutput:
-    sql_body = f"""CREATE OR REPLACE FUNCTION {func_name}(s STRUCT<a: SHORT NOT NULL COMMENT 'short field', b: MAP<STRING, FLOAT>, c: INT NOT NULL>)
+# SQL bodies are built once at import with a single {func_name} slot; the
+# builders below only pay for the small format call per distinct name, and
+# lru_cache skips even that when a test reuses the same function name.
+_STRUCT_INPUT_SQL = """CREATE OR REPLACE FUNCTION {func_name}(s STRUCT<a: SHORT NOT NULL COMMENT 'short field', b: MAP<STRING, FLOAT>, c: INT NOT NULL>)
 RETURNS STRING
 LANGUAGE PYTHON
 AS $$
@@ -71,55 +99,118 @@ AS $$
   return result
 $$
 """
-    return FunctionInputOutput(
-        sql_body=sql_body,
-        inputs=[{"s": {"a": 1, "b": {"2": 2, "3.0": 3.0}, "c": 4}}],
-        output="1;2=>2.0,3.0=>3.0;4",
-    )
-
 
-def function_with_array_input(func_name: str) -> FunctionInputOutput:
-    sql_body = f"""CREATE FUNCTION {func_name}(s ARRAY<BYTE>)
+_ARRAY_INPUT_SQL = """CREATE FUNCTION {func_name}(s ARRAY<BYTE>)
 RETURNS STRING
 LANGUAGE PYTHON
 AS $$
     return ",".join(str(i) for i in s)
 $$
 """
-    return FunctionInputOutput(
-        sql_body=sql_body,
-        inputs=[{"s": [1, 2, 3]}],
-        output="1,2,3",
-    )
-
 
-def function_with_string_input(func_name: str) -> FunctionInputOutput:
-    sql_body = f"""CREATE FUNCTION {func_name}(s STRING)
+_STRING_INPUT_SQL = """CREATE FUNCTION {func_name}(s STRING)
 RETURNS STRING
 LANGUAGE PYTHON
 AS $$
     return s
 $$
 """
-    return FunctionInputOutput(
-        sql_body=sql_body,
-        inputs=[{"s": "abc"}],
-        output="abc",
-    )
 
-
-def function_with_binary_input(func_name: str) -> FunctionInputOutput:
-    sql_body = f"""CREATE FUNCTION {func_name}(s BINARY)
+_BINARY_INPUT_SQL = """CREATE FUNCTION {func_name}(s BINARY)
 RETURNS STRING
 LANGUAGE PYTHON
 AS $$
   return s.decode('utf-8')
 $$
 """
+
+_INTERVAL_INPUT_SQL = """CREATE FUNCTION {func_name}(s INTERVAL DAY TO SECOND)
+RETURNS STRING
+LANGUAGE PYTHON
+AS $$
+  import datetime
+
+  return (datetime.datetime(2024, 8, 19) - s).isoformat()
+$$
+"""
+
+_TIMESTAMP_INPUT_SQL = """CREATE FUNCTION {func_name}(x TIMESTAMP, y TIMESTAMP_NTZ)
+RETURNS STRING
+LANGUAGE PYTHON
+AS $$
+  return str(x.isoformat()) + "; " + str(y.isoformat())
+$$
+"""
+
+_DATE_INPUT_SQL = """CREATE FUNCTION {func_name}(s DATE)
+RETURNS STRING
+LANGUAGE PYTHON
+AS $$
+  return s.isoformat()
+$$
+"""
+
+_MAP_INPUT_SQL = """CREATE FUNCTION {func_name}(s MAP<STRING, ARRAY<INT>>)
+RETURNS STRING
+LANGUAGE PYTHON
+AS $$
+  result = []
+  for x, y in s.items():
+     result.append(str(x) + " => " + str(y))
+  return ",".join(result)
+$$
+"""
+
+_DECIMAL_INPUT_SQL = """CREATE FUNCTION {func_name}(s DECIMAL(10, 2))
+RETURNS STRING
+LANGUAGE PYTHON
+AS $$
+    return str(s)
+$$
+"""
+
+_TABLE_OUTPUT_SQL = """CREATE FUNCTION {func_name}(start DATE, end DATE)
+RETURNS TABLE(day_of_week STRING, day DATE)
+RETURN SELECT extract(DAYOFWEEK_ISO FROM day), day
+            FROM (SELECT sequence({function_name}.start, {function_name}.end)) AS T(days)
+                LATERAL VIEW explode(days) AS day
+            WHERE extract(DAYOFWEEK_ISO FROM day) BETWEEN 1 AND 5;
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def function_with_struct_input(func_name: str) -> FunctionInputOutput:
     return FunctionInputOutput(
-        sql_body=sql_body,
+        sql_body=_STRUCT_INPUT_SQL.format(func_name=func_name),
+        inputs=[{"s": {"a": 1, "b": {"2": 2, "3.0": 3.0}, "c": 4}}],
+        output="1;2=>2.0,3.0=>3.0;4",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def function_with_array_input(func_name: str) -> FunctionInputOutput:
+    return FunctionInputOutput(
+        sql_body=_ARRAY_INPUT_SQL.format(func_name=func_name),
+        inputs=[{"s": [1, 2, 3]}],
+        output="1,2,3",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def function_with_string_input(func_name: str) -> FunctionInputOutput:
+    return FunctionInputOutput(
+        sql_body=_STRING_INPUT_SQL.format(func_name=func_name),
+        inputs=[{"s": "abc"}],
+        output="abc",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def function_with_binary_input(func_name: str) -> FunctionInputOutput:
+    return FunctionInputOutput(
+        sql_body=_BINARY_INPUT_SQL.format(func_name=func_name),
         inputs=[
-            {"s": base64.b64encode(b"Hello").decode("utf-8")},
+            {"s": _HELLO_B64},
             {"s": "SGVsbG8="},
             {"s": b"Hello"},
         ],
@@ -127,18 +218,10 @@ $$
     )
 
 
+@functools.lru_cache(maxsize=None)
 def function_with_interval_input(func_name: str) -> FunctionInputOutput:
-    sql_body = f"""CREATE FUNCTION {func_name}(s INTERVAL DAY TO SECOND)
-RETURNS STRING
-LANGUAGE PYTHON
-AS $$
-  import datetime
-
-  return (datetime.datetime(2024, 8, 19) - s).isoformat()
-$$
-"""
     return FunctionInputOutput(
-        sql_body=sql_body,
+        sql_body=_INTERVAL_INPUT_SQL.format(func_name=func_name),
         inputs=[
             {"s": "INTERVAL '0 0:16:40.123456' DAY TO SECOND"},
             {"s": datetime.timedelta(days=0, hours=0, minutes=16, seconds=40, microseconds=123456)},
@@ -148,20 +231,14 @@ $$
     )
 
 
+@functools.lru_cache(maxsize=None)
 def function_with_timestamp_input(func_name: str) -> FunctionInputOutput:
-    sql_body = f"""CREATE FUNCTION {func_name}(x TIMESTAMP, y TIMESTAMP_NTZ)
-RETURNS STRING
-LANGUAGE PYTHON
-AS $$
-  return str(x.isoformat()) + "; " + str(y.isoformat())
-$$
-"""
     return FunctionInputOutput(
-        sql_body=sql_body,
+        sql_body=_TIMESTAMP_INPUT_SQL.format(func_name=func_name),
         inputs=[
             {
-                "x": datetime.datetime(2024, 8, 19, 11, 2, 3),
-                "y": datetime.datetime(2024, 8, 19, 11, 2, 3),
+                "x": _TEST_DATETIME,
+                "y": _TEST_DATETIME,
             },
             {"x": "2024-08-19T11:02:03", "y": "2024-08-19T11:02:03"},
         ],
@@ -169,65 +246,38 @@ $$
     )
 
 
+@functools.lru_cache(maxsize=None)
 def function_with_date_input(func_name: str) -> FunctionInputOutput:
-    sql_body = f"""CREATE FUNCTION {func_name}(s DATE)
-RETURNS STRING
-LANGUAGE PYTHON
-AS $$
-  return s.isoformat()
-$$
-"""
     return FunctionInputOutput(
-        sql_body=sql_body,
-        inputs=[{"s": datetime.date(2024, 8, 19)}, {"s": "2024-08-19"}],
+        sql_body=_DATE_INPUT_SQL.format(func_name=func_name),
+        inputs=[{"s": _TEST_DATE}, {"s": "2024-08-19"}],
         output="2024-08-19",
     )
 
 
+@functools.lru_cache(maxsize=None)
 def function_with_map_input(func_name: str) -> FunctionInputOutput:
-    sql_body = f"""CREATE FUNCTION {func_name}(s MAP<STRING, ARRAY<INT>>)
-RETURNS STRING
-LANGUAGE PYTHON
-AS $$
-  result = []
-  for x, y in s.items():
-     result.append(str(x) + " => " + str(y))
-  return ",".join(result)
-$$
-"""
     return FunctionInputOutput(
-        sql_body=sql_body,
+        sql_body=_MAP_INPUT_SQL.format(func_name=func_name),
         inputs=[{"s": {"a": [1, 2, 3], "b": [4, 5, 6]}}],
         output="a => [1, 2, 3],b => [4, 5, 6]",
     )
 
 
+@functools.lru_cache(maxsize=None)
 def function_with_decimal_input(func_name: str) -> FunctionInputOutput:
-    sql_body = f"""CREATE FUNCTION {func_name}(s DECIMAL(10, 2))
-RETURNS STRING
-LANGUAGE PYTHON
-AS $$
-    return str(s)
-$$
-"""
     return FunctionInputOutput(
-        sql_body=sql_body,
-        inputs=[{"s": 123.45}, {"s": Decimal("123.45")}],
+        sql_body=_DECIMAL_INPUT_SQL.format(func_name=func_name),
+        inputs=[{"s": 123.45}, {"s": _TEST_DECIMAL}],
         output="123.45",
     )
 
 
+@functools.lru_cache(maxsize=None)
 def function_with_table_output(func_name: str) -> FunctionInputOutput:
     function_name = func_name.split(".")[-1]
-    sql_body = f"""CREATE FUNCTION {func_name}(start DATE, end DATE)
-RETURNS TABLE(day_of_week STRING, day DATE)
-RETURN SELECT extract(DAYOFWEEK_ISO FROM day), day
-            FROM (SELECT sequence({function_name}.start, {function_name}.end)) AS T(days)
-                LATERAL VIEW explode(days) AS day
-            WHERE extract(DAYOFWEEK_ISO FROM day) BETWEEN 1 AND 5;
-"""
     return FunctionInputOutput(
-        sql_body=sql_body,
+        sql_body=_TABLE_OUTPUT_SQL.format(func_name=func_name, function_name=function_name),
         inputs=[{"start": datetime.date(2024, 1, 1), "end": "2024-01-07"}],
         output="day_of_week,day\n1,2024-01-01\n2,2024-01-02\n3,2024-01-03\n4,2024-01-04\n5,2024-01-05\n",
     )
@@ -277,7 +327,7 @@ def python_function_with_binary_input() -> PythonFunctionInputOutput:
     return PythonFunctionInputOutput(
         func=function_with_binary_input,
         inputs=[
-            {"s": base64.b64encode(b"Hello").decode("utf-8")},
+            {"s": _HELLO_B64},
             {"s": "SGVsbG8="},
         ],
         output="Hello",
@@ -310,8 +360,8 @@ def python_function_with_timestamp_input() -> PythonFunctionInputOutput:
         func=function_with_timestamp_input,
         inputs=[
             {
-                "x": datetime.datetime(2024, 8, 19, 11, 2, 3),
-                "y": datetime.datetime(2024, 8, 19, 11, 2, 3),
+                "x": _TEST_DATETIME,
+                "y": _TEST_DATETIME,
             },
             {"x": "2024-08-19T11:02:03", "y": "2024-08-19T11:02:03"},
         ],
@@ -326,7 +376,7 @@ def python_function_with_date_input() -> PythonFunctionInputOutput:
 
     return PythonFunctionInputOutput(
         func=function_with_date_input,
-        inputs=[{"s": datetime.date(2024, 8, 19)}, {"s": "2024-08-19"}],
+        inputs=[{"s": _TEST_DATE}, {"s": "2024-08-19"}],
         output="2024-08-19",
     )
 
@@ -358,49 +408,58 @@ def python_function_with_decimal_input() -> PythonFunctionInputOutput:
     )
 
 
+_SQL_FUNCTION_BUILDERS = [
+    function_with_array_input,
+    function_with_struct_input,
+    function_with_string_input,
+    function_with_binary_input,
+    function_with_interval_input,
+    function_with_timestamp_input,
+    function_with_date_input,
+    function_with_map_input,
+    function_with_decimal_input,
+    function_with_table_output,
+]
+
+
+@pytest.fixture(scope="module")
+def created_sql_functions(client):
+    """Create every SQL sample function once per module and drop them all on teardown.
+
+    Creating and dropping per parametrize case costs two network round-trips
+    per sample; batching the creates lets each case pay only for execution.
+    """
+    samples = {}
+    try:
+        for create_function in _SQL_FUNCTION_BUILDERS:
+            func_name = random_func_name(schema=SCHEMA)
+            sample = create_function(func_name)
+            client.create_function(sql_function_body=sample.sql_body)
+            samples[create_function.__name__] = (func_name, sample)
+        yield samples
+    finally:
+        for func_name, _ in samples.values():
+            try:
+                client.delete_function(func_name)
+            except Exception as e:
+                _logger.warning(f"Fail to delete function: {e}")
+
+
 @requires_databricks
-@pytest.mark.parametrize(
-    "create_function",
-    [
-        function_with_array_input,
-        function_with_struct_input,
-        function_with_string_input,
-        function_with_binary_input,
-        function_with_interval_input,
-        function_with_timestamp_input,
-        function_with_date_input,
-        function_with_map_input,
-        function_with_decimal_input,
-        function_with_table_output,
-    ],
-)
+@pytest.mark.parametrize("create_function", _SQL_FUNCTION_BUILDERS)
 def test_create_and_execute_function(
-    client: DatabricksFunctionClient, create_function: Callable[[str], FunctionInputOutput]
+    client: DatabricksFunctionClient,
+    created_sql_functions,
+    create_function: Callable[[str], FunctionInputOutput],
 ):
-    with generate_func_name_and_cleanup(client, schema=SCHEMA) as func_name:
-        function_sample = create_function(func_name)
-        client.create_function(sql_function_body=function_sample.sql_body)
-        for input_example in function_sample.inputs:
-            result = client.execute_function(func_name, input_example)
-            assert result.value == function_sample.output
+    func_name, function_sample = created_sql_functions[create_function.__name__]
+    for input_example in function_sample.inputs:
+        result = client.execute_function(func_name, input_example)
+        assert result.value == function_sample.output
 
 
 @requires_databricks
-@pytest.mark.parametrize(
-    "create_function",
-    [
-        function_with_array_input,
-        function_with_struct_input,
-        function_with_string_input,
-        function_with_binary_input,
-        function_with_interval_input,
-        function_with_timestamp_input,
-        function_with_date_input,
-        function_with_map_input,
-        function_with_decimal_input,
-        function_with_table_output,
-    ],
-)
+@pytest.mark.parametrize("create_function", _SQL_FUNCTION_BUILDERS)
 def test_create_and_execute_function_using_serverless(
     serverless_client: DatabricksFunctionClient,
     create_function: Callable[[str], FunctionInputOutput],
@@ -550,39 +609,55 @@ def test_delete_function(serverless_client: DatabricksFunctionClient):
         serverless_client.get_function(function_name)
 
 
+# Shared at module scope so the long SQL bodies are kept once, with short
+# explicit ids instead of pytest deriving them from the full statements.
+_EXTRACT_NAME_CASES = (
+    (
+        "CREATE OR REPLACE FUNCTION a.b.test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
+        "a.b.test",
+    ),
+    (
+        "CREATE TEMPORARY FUNCTION a.b.test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
+        "a.b.test",
+    ),
+    ("CREATE FUNCTION IF NOT EXISTS a.b.test() RETURN 123", "a.b.test"),
+    (
+        "CREATE FUNCTION `some-catalog`.`some-schema`.`test_function`() RETURN 123",
+        "some-catalog.some-schema.test_function",
+    ),
+    (
+        "CREATE FUNCTION `奇怪的catalog`.`some-schema`.test_function() RETURN 123",
+        "奇怪的catalog.some-schema.test_function",
+    ),
+)
+
+_EXTRACT_NAME_NOT_FULL_CASES = (
+    "CREATE OR REPLACE FUNCTION test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
+    "CREATE FUNCTION a.test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
+    "CREATE TEMPORARY FUNCTION IF NOT EXISTS test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
+)
+
+_EXTRACT_NAME_ERROR_CASES = (
+    "CREATE OR REPLACE FUNCTION (s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
+    "CREATE FUNCTION RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
+    "CREATE FUNCTION a.b. RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
+    "UPDATE FUNCTION a.b.test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
+)
+
+
 @pytest.mark.parametrize(
     ("sql_body", "function_name"),
-    [
-        (
-            "CREATE OR REPLACE FUNCTION a.b.test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
-            "a.b.test",
-        ),
-        (
-            "CREATE TEMPORARY FUNCTION a.b.test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
-            "a.b.test",
-        ),
-        ("CREATE FUNCTION IF NOT EXISTS a.b.test() RETURN 123", "a.b.test"),
-        (
-            "CREATE FUNCTION `some-catalog`.`some-schema`.`test_function`() RETURN 123",
-            "some-catalog.some-schema.test_function",
-        ),
-        (
-            "CREATE FUNCTION `奇怪的catalog`.`some-schema`.test_function() RETURN 123",
-            "奇怪的catalog.some-schema.test_function",
-        ),
-    ],
+    _EXTRACT_NAME_CASES,
+    ids=["create_or_replace", "temporary", "if_not_exists", "backticked", "non_ascii_catalog"],
 )
 def test_extract_function_name(sql_body, function_name):
     assert extract_function_name(sql_body) == function_name
 
 
 @pytest.mark.parametrize(
-    ("sql_body"),
-    [
-        "CREATE OR REPLACE FUNCTION test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
-        "CREATE FUNCTION a.test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
-        "CREATE TEMPORARY FUNCTION IF NOT EXISTS test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
-    ],
+    "sql_body",
+    _EXTRACT_NAME_NOT_FULL_CASES,
+    ids=["name_only", "schema_and_name", "temporary_name_only"],
 )
 def test_invalid_function_name(sql_body):
     with pytest.raises(ValueError, match=r"Could not extract function name from the sql body"):
@@ -591,190 +666,68 @@ def test_invalid_function_name(sql_body):
 
 @pytest.mark.parametrize(
     "sql_body",
-    [
-        "CREATE OR REPLACE FUNCTION (s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
-        "CREATE FUNCTION RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
-        "CREATE FUNCTION a.b. RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
-        "UPDATE FUNCTION a.b.test(s STRING) RETURNS STRING LANGUAGE PYTHON AS $$ return s $$",
-    ],
+    _EXTRACT_NAME_ERROR_CASES,
+    ids=["missing_name", "missing_signature", "trailing_dot", "not_create"],
 )
 def test_extract_function_name_error(sql_body):
     with pytest.raises(ValueError, match="Could not extract function name from the sql body."):
         extract_function_name(sql_body)
 
 
-@pytest.mark.parametrize(
-    ("param_value", "param_info"),
-    [
-        (
-            [1, 2, 3],
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.ARRAY, type_text="array<int>", position=0
-            ),
-        ),
-        (
-            ("a", "b"),
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.ARRAY, type_text="array<string>", position=1
-            ),
-        ),
-        (
-            "SEVMTE8=",
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.BINARY, type_text="binary", position=2
-            ),
-        ),
-        (
-            True,
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.BOOLEAN, type_text="boolean", position=3
-            ),
-        ),
-        (
-            123456,
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.BYTE, type_text="byte", position=4
-            ),
-        ),
-        (
-            "some_char",
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.CHAR, type_text="char", position=5
-            ),
-        ),
-        (
-            datetime.date(2024, 8, 19),
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.DATE, type_text="date", position=6
-            ),
-        ),
-        (
-            "2024-08-19",
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.DATE, type_text="date", position=7
-            ),
-        ),
-        (
-            123.45,
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.DECIMAL, type_text="decimal", position=8
-            ),
-        ),
-        (
-            Decimal("123.45"),
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.DECIMAL, type_text="decimal", position=9
-            ),
-        ),
-        (
-            123.45,
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.DOUBLE, type_text="double", position=10
-            ),
-        ),
-        (
-            123.45,
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.FLOAT, type_text="float", position=11
-            ),
-        ),
-        (
-            123,
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.INT, type_text="int", position=12
-            ),
-        ),
-        (
-            datetime.timedelta(days=1, hours=3),
-            FunctionParameterInfo(
-                "param",
-                type_name=ColumnTypeName.INTERVAL,
-                type_text="interval day to second",
-                position=13,
-            ),
-        ),
-        (
-            "INTERVAL '1 3:00:00' DAY TO SECOND",
-            FunctionParameterInfo(
-                "param",
-                type_name=ColumnTypeName.INTERVAL,
-                type_text="interval day to second",
-                position=14,
-            ),
-        ),
-        (
-            123,
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.LONG, type_text="long", position=15
-            ),
-        ),
-        (
-            {"a": 1, "b": 2},
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.MAP, type_text="map<string, int>", position=16
-            ),
-        ),
-        (
-            {"a": [1, 2, 3], "b": [4, 5, 6]},
-            FunctionParameterInfo(
-                "param",
-                type_name=ColumnTypeName.MAP,
-                type_text="map<string, array<int>>",
-                position=17,
-            ),
-        ),
-        (
-            123,
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.SHORT, type_text="short", position=18
-            ),
-        ),
-        (
-            "some_string",
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.STRING, type_text="string", position=19
-            ),
-        ),
-        (
-            {"spark": 123},
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.STRUCT, type_text="struct<spark:int>", position=20
-            ),
-        ),
-        (
-            datetime.datetime(2024, 8, 19, 11, 2, 3),
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.TIMESTAMP, type_text="timestamp", position=21
-            ),
-        ),
-        (
-            "2024-08-19T11:02:03",
-            FunctionParameterInfo(
-                "param", type_name=ColumnTypeName.TIMESTAMP, type_text="timestamp", position=22
-            ),
-        ),
-        (
-            datetime.datetime(2024, 8, 19, 11, 2, 3),
-            FunctionParameterInfo(
-                "param",
-                type_name=ColumnTypeName.TIMESTAMP_NTZ,
-                type_text="timestamp_ntz",
-                position=23,
-            ),
-        ),
-        (
-            "2024-08-19T11:02:03",
-            FunctionParameterInfo(
-                "param",
-                type_name=ColumnTypeName.TIMESTAMP_NTZ,
-                type_text="timestamp_ntz",
-                position=24,
-            ),
-        ),
-    ],
+@functools.lru_cache(maxsize=None)
+def _param_info(type_name: ColumnTypeName, type_text: str) -> FunctionParameterInfo:
+    # _validate_param_type never reads the position, so one shared instance per
+    # (type_name, type_text) pair is enough for every case below.
+    return FunctionParameterInfo("param", type_name=type_name, type_text=type_text, position=0)
+
+
+_VALID_PARAM_CASES = (
+    ([1, 2, 3], _param_info(ColumnTypeName.ARRAY, "array<int>")),
+    (("a", "b"), _param_info(ColumnTypeName.ARRAY, "array<string>")),
+    ("SEVMTE8=", _param_info(ColumnTypeName.BINARY, "binary")),
+    (True, _param_info(ColumnTypeName.BOOLEAN, "boolean")),
+    (123456, _param_info(ColumnTypeName.BYTE, "byte")),
+    ("some_char", _param_info(ColumnTypeName.CHAR, "char")),
+    (_TEST_DATE, _param_info(ColumnTypeName.DATE, "date")),
+    ("2024-08-19", _param_info(ColumnTypeName.DATE, "date")),
+    (123.45, _param_info(ColumnTypeName.DECIMAL, "decimal")),
+    (_TEST_DECIMAL, _param_info(ColumnTypeName.DECIMAL, "decimal")),
+    (123.45, _param_info(ColumnTypeName.DOUBLE, "double")),
+    (123.45, _param_info(ColumnTypeName.FLOAT, "float")),
+    (123, _param_info(ColumnTypeName.INT, "int")),
+    (
+        _TEST_TIMEDELTA,
+        _param_info(ColumnTypeName.INTERVAL, "interval day to second"),
+    ),
+    (
+        "INTERVAL '1 3:00:00' DAY TO SECOND",
+        _param_info(ColumnTypeName.INTERVAL, "interval day to second"),
+    ),
+    (123, _param_info(ColumnTypeName.LONG, "long")),
+    ({"a": 1, "b": 2}, _param_info(ColumnTypeName.MAP, "map<string, int>")),
+    ({"a": [1, 2, 3], "b": [4, 5, 6]}, _param_info(ColumnTypeName.MAP, "map<string, array<int>>")),
+    (123, _param_info(ColumnTypeName.SHORT, "short")),
+    ("some_string", _param_info(ColumnTypeName.STRING, "string")),
+    ({"spark": 123}, _param_info(ColumnTypeName.STRUCT, "struct<spark:int>")),
+    (_TEST_DATETIME, _param_info(ColumnTypeName.TIMESTAMP, "timestamp")),
+    ("2024-08-19T11:02:03", _param_info(ColumnTypeName.TIMESTAMP, "timestamp")),
+    (
+        _TEST_DATETIME,
+        _param_info(ColumnTypeName.TIMESTAMP_NTZ, "timestamp_ntz"),
+    ),
+    ("2024-08-19T11:02:03", _param_info(ColumnTypeName.TIMESTAMP_NTZ, "timestamp_ntz")),
 )
-def test_validate_param_type(client: DatabricksFunctionClient, param_value, param_info):
-    client._validate_param_type(param_value, param_info)
+
+
+def test_validate_param_type(client: DatabricksFunctionClient):
+    # A plain loop instead of a 25-way parametrize: _validate_param_type is a
+    # stateless call, so per-case test items and fixture resolution buy
+    # nothing. The type text identifies any failing case.
+    for param_value, param_info in _VALID_PARAM_CASES:
+        try:
+            client._validate_param_type(param_value, param_info)
+        except ValueError as e:
+            pytest.fail(f"Validation failed for {param_info.type_text} value {param_value!r}: {e}")
 
 
 def test_validate_param_type_errors(client: DatabricksFunctionClient):
@@ -832,7 +785,9 @@ def test_validate_param_type_errors(client: DatabricksFunctionClient):
         )
 
 
-@pytest.fixture
+# Module-scoped: the FunctionInfo is a large SDK object that no consumer
+# mutates, so one instance per module is enough.
+@pytest.fixture(scope="module")
 def good_function_info():
     func_name = random_func_name(schema=SCHEMA).split(".")[-1]
     return FunctionInfo(